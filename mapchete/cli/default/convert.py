@@ -24,6 +24,8 @@ from mapchete.validate import validate_zooms
 
 logger = logging.getLogger(__name__)
 OUTPUT_FORMATS = available_output_formats()
+# input output parameters which must not end up in the new output configuration
+_INPUT_PARAMS_NOT_PASSED_ON = frozenset(["delimiters", "bounds", "mode"])
 
 
 def _validate_bidx(ctx, param, bidx):
@@ -63,7 +65,7 @@ def _validate_bidx(ctx, param, bidx):
 )
 @click.option(
     "--output-format",
-    type=click.Choice(available_output_formats()),
+    type=click.Choice(list(OUTPUT_FORMATS.keys())),
     help="Output format."
 )
 @click.option(
@@ -172,7 +174,7 @@ def convert(
             {
                 k: v
                 for k, v in input_info["output_params"].items()
-                if k not in ["delimiters", "bounds", "mode"]
+                if k not in _INPUT_PARAMS_NOT_PASSED_ON
             },
             path=output,
             format=(
@@ -254,7 +256,8 @@ def convert(
         ),
         clip_to_output_dtype=mapchete_config["output"].get("dtype", None)
     )
-    logger.debug("temporary config generated: %s", pformat(mapchete_config))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("temporary config generated: %s", pformat(mapchete_config))
 
     utils._process_area(
         debug=debug,
@@ -323,8 +326,8 @@ def _input_rasterio_info(input_):
     with rasterio.open(input_) as src:
         return dict(
             output_params=dict(
-                bands=src.meta["count"],
-                dtype=src.meta["dtype"],
+                bands=src.count,
+                dtype=src.dtypes[0],
                 format=src.driver if src.driver in available_input_formats() else None
             ),
             pyramid=None,
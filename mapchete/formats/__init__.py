@@ -20,6 +20,32 @@ from mapchete.tile import BufferedTilePyramid
 
 logger = logging.getLogger(__name__)
 
+# loaded driver modules, populated on first access by _drivers()
+_DRIVER_REGISTRY = None
+
+
+def _drivers():
+    """
+    Return all registered drivers mapped to their driver names.
+
+    Driver entry points are loaded only once per process.
+
+    Returns
+    -------
+    drivers : dict
+        driver modules with their driver name as key
+    """
+    global _DRIVER_REGISTRY
+    if _DRIVER_REGISTRY is None:
+        registry = {}
+        for v in drivers:
+            logger.debug("driver found: %s", v)
+            driver_ = v.load()
+            if hasattr(driver_, "METADATA"):
+                registry[driver_.METADATA["driver_name"]] = driver_
+        _DRIVER_REGISTRY = registry
+    return _DRIVER_REGISTRY
+
 
 def available_output_formats():
     """
@@ -30,12 +56,11 @@ def available_output_formats():
     formats : list
         all available output formats
     """
-    output_formats = {}
-    for v in drivers:
-        driver_ = v.load()
-        if hasattr(driver_, "METADATA") and (driver_.METADATA["mode"] in ["w", "rw"]):
-            output_formats[driver_.METADATA["driver_name"]] = driver_.METADATA
-    return output_formats
+    return {
+        driver_name: driver_.METADATA
+        for driver_name, driver_ in _drivers().items()
+        if driver_.METADATA["mode"] in ["w", "rw"]
+    }
 
 
 def available_input_formats():
@@ -47,13 +72,20 @@ def available_input_formats():
     formats : list
         all available input formats
     """
-    input_formats = {}
-    for v in drivers:
-        logger.debug("driver found: %s", v)
-        driver_ = v.load()
-        if hasattr(driver_, "METADATA") and (driver_.METADATA["mode"] in ["r", "rw"]):
-            input_formats[driver_.METADATA["driver_name"]] = driver_.METADATA
-    return input_formats
+    return {
+        driver_name: driver_.METADATA
+        for driver_name, driver_ in _drivers().items()
+        if driver_.METADATA["mode"] in ["r", "rw"]
+    }
+
+
+def _load_driver(driver_name, attr):
+    try:
+        return getattr(_drivers()[driver_name], attr)
+    except (KeyError, AttributeError):
+        raise MapcheteDriverError(
+            "no loader for driver '%s' could be found." % driver_name
+        )
 
 
 def load_output_reader(output_params):
@@ -67,16 +99,9 @@ def load_output_reader(output_params):
     """
     if not isinstance(output_params, dict):
         raise TypeError("output_params must be a dictionary")
-    driver_name = output_params["format"]
-    for v in drivers:
-        _driver = v.load()
-        if all(
-            [hasattr(_driver, attr) for attr in ["OutputDataReader", "METADATA"]]
-            ) and (
-            _driver.METADATA["driver_name"] == driver_name
-        ):
-            return _driver.OutputDataReader(output_params, readonly=True)
-    raise MapcheteDriverError("no loader for driver '%s' could be found." % driver_name)
+    return _load_driver(output_params["format"], "OutputDataReader")(
+        output_params, readonly=True
+    )
 
 
 def load_output_writer(output_params, readonly=False):
@@ -90,16 +115,9 @@ def load_output_writer(output_params, readonly=False):
     """
     if not isinstance(output_params, dict):
         raise TypeError("output_params must be a dictionary")
-    driver_name = output_params["format"]
-    for v in drivers:
-        _driver = v.load()
-        if all(
-            [hasattr(_driver, attr) for attr in ["OutputDataWriter", "METADATA"]]
-            ) and (
-            _driver.METADATA["driver_name"] == driver_name
-        ):
-            return _driver.OutputDataWriter(output_params, readonly=readonly)
-    raise MapcheteDriverError("no loader for driver '%s' could be found." % driver_name)
+    return _load_driver(output_params["format"], "OutputDataWriter")(
+        output_params, readonly=readonly
+    )
 
 
 def load_input_reader(input_params, readonly=False):
@@ -125,13 +143,7 @@ def load_input_reader(input_params, readonly=False):
             driver_name = "TileDirectory"
     else:
         raise MapcheteDriverError("invalid input parameters %s" % input_params)
-    for v in drivers:
-        driver_ = v.load()
-        if hasattr(driver_, "METADATA") and (
-            driver_.METADATA["driver_name"] == driver_name
-        ):
-            return v.load().InputData(input_params, readonly=readonly)
-    raise MapcheteDriverError("no loader for driver '%s' could be found." % driver_name)
+    return _load_driver(driver_name, "InputData")(input_params, readonly=readonly)
 
 
 def driver_from_file(input_file):
@@ -143,8 +155,8 @@ def driver_from_file(input_file):
     driver : string
         driver name
     """
-    file_ext = os.path.splitext(input_file)[1].split(".")[1]
-    if file_ext == "mapchete":
+    _, sep, file_ext = os.path.basename(input_file).rpartition(".")
+    if sep and file_ext.lower() == "mapchete":
         return "Mapchete"
     try:
         with rasterio.open(input_file):
@@ -166,12 +178,12 @@ def driver_from_file(input_file):
 def params_to_dump(params):
     # in case GridDefinition was not yet initialized
     return dict(
-        pyramid=BufferedTilePyramid(
+        pyramid=BufferedTilePyramid.from_dict(dict(
             grid=params["grid"],
             tile_size=params.get("tile_size", 256),
             metatiling=params.get("metatiling", 1),
             pixelbuffer=params.get("pixelbuffer", 0),
-        ).to_dict(),
+        )).to_dict(),
         driver={
            k: v
            for k, v in params.items()
@@ -204,12 +216,12 @@ def read_output_metadata(metadata_json):
         )
         params["pyramid"]["grid"].update(srs=dict(wkt=crs.to_wkt()))
     params.update(
-        pyramid=BufferedTilePyramid(
-            params["pyramid"]["grid"],
+        pyramid=BufferedTilePyramid.from_dict(dict(
+            grid=params["pyramid"]["grid"],
             metatiling=params["pyramid"].get("metatiling", 1),
             tile_size=params["pyramid"].get("tile_size", 256),
             pixelbuffer=params["pyramid"].get("pixelbuffer", 0)
-        )
+        ))
     )
     return params
 
@@ -222,11 +234,12 @@ def write_output_metadata(output_params):
         try:
             existing_params = read_output_metadata(metadata_path)
             logger.debug("%s exists", metadata_path)
-            logger.debug("existing output parameters: %s", pformat(existing_params))
             existing_tp = existing_params["pyramid"]
             current_params = params_to_dump(output_params)
-            logger.debug("current output parameters: %s", pformat(current_params))
-            current_tp = BufferedTilePyramid(**current_params["pyramid"])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("existing output parameters: %s", pformat(existing_params))
+                logger.debug("current output parameters: %s", pformat(current_params))
+            current_tp = BufferedTilePyramid.from_dict(current_params["pyramid"])
             if existing_tp != current_tp:  # pragma: no cover
                 raise MapcheteConfigError(
                     "pyramid definitions between existing and new output do not match: "
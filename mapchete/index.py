@@ -22,17 +22,24 @@ generate GPKG files 3.gpkg, 4.gpkg and 5.gpkg for zoom levels 3, 4 and 5.
 from contextlib import ExitStack
 from copy import deepcopy
 import fiona
+import json
 import logging
 import operator
 import os
 from rasterio.dtypes import _gdal_typename
-from shapely.geometry import mapping
+import tempfile
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from mapchete.config import get_zoom_levels
 from mapchete.io import (
-    path_exists, path_is_remote, get_boto3_bucket, raster, relative_path, tiles_exist
+    path_exists, path_is_remote, get_boto3_bucket, raster, read_json, relative_path,
+    tiles_exist
 )
 
 logger = logging.getLogger(__name__)
@@ -46,6 +53,8 @@ spatial_schema = {
         "col": "int"
     }
 }
+# number of features buffered by VectorFileWriter before writing them at once
+VECTOR_WRITE_BATCH_SIZE = 4096
 
 
 def zoom_index_gen(
@@ -98,8 +107,7 @@ def zoom_index_gen(
             if geojson:
                 index_writers.append(
                     es.enter_context(
-                        VectorFileWriter(
-                            driver="GeoJSON",
+                        _geojson_index_writer(
                             out_path=_index_file_path(out_dir, zoom, "geojson"),
                             crs=mp.config.output_pyramid.crs,
                             fieldname=fieldname
@@ -155,6 +163,8 @@ def zoom_index_gen(
                 )
             )
 
+            tile_path_func = _tile_path_func(basepath=basepath, for_gdal=for_gdal)
+
             # check which tiles exist in any index
             logger.debug("check which tiles exist in index(es)")
             existing_in_any_index = set(
@@ -163,11 +173,7 @@ def zoom_index_gen(
                     [
                         i.entry_exists(
                             tile=tile,
-                            path=_tile_path(
-                                orig_path=mp.config.output.get_path(tile),
-                                basepath=basepath,
-                                for_gdal=for_gdal
-                            )
+                            path=tile_path_func(mp.config.output.get_path(tile))
                         )
                         for i in index_writers
                     ]
@@ -181,11 +187,7 @@ def zoom_index_gen(
             for tile, output_exists in tiles_exist(
                 mp.config, output_tiles=output_tiles.difference(existing_in_any_index)
             ):
-                tile_path = _tile_path(
-                    orig_path=mp.config.output.get_path(tile),
-                    basepath=basepath,
-                    for_gdal=for_gdal
-                )
+                tile_path = tile_path_func(mp.config.output.get_path(tile))
                 indexes = [
                     i for i in index_writers
                     if not i.entry_exists(tile=tile, path=tile_path)
@@ -200,11 +202,7 @@ def zoom_index_gen(
 
             # tiles which exist in at least one index
             for tile in existing_in_any_index:
-                tile_path = _tile_path(
-                    orig_path=mp.config.output.get_path(tile),
-                    basepath=basepath,
-                    for_gdal=for_gdal
-                )
+                tile_path = tile_path_func(mp.config.output.get_path(tile))
                 indexes = [
                     i for i in index_writers
                     if not i.entry_exists(tile=tile, path=tile_path)
@@ -223,20 +221,63 @@ def _index_file_path(out_dir, zoom, ext):
 
 
 def _tile_path(orig_path=None, basepath=None, for_gdal=True):
-    path = (
-        os.path.join(basepath, "/".join(orig_path.split("/")[-3:])) if basepath
-        else orig_path
-    )
-    if for_gdal and path.startswith(("http://", "https://")):
-        return "/vsicurl/" + path
-    elif for_gdal and path.startswith("s3://"):
-        return path.replace("s3://", "/vsis3/")
+    return _tile_path_func(basepath=basepath, for_gdal=for_gdal)(orig_path)
+
+
+def _tile_path_func(basepath=None, for_gdal=True):
+    # resolve base path prefix once so it can be reused for every tile
+    basepath_prefix = basepath.rstrip("/") + "/" if basepath else None
+
+    def _func(orig_path):
+        path = (
+            basepath_prefix + "/".join(orig_path.rsplit("/", 3)[-3:])
+            if basepath_prefix
+            else orig_path
+        )
+        if for_gdal and path.startswith(("http://", "https://")):
+            return "/vsicurl/" + path
+        elif for_gdal and path.startswith("s3://"):
+            return path.replace("s3://", "/vsis3/")
+        else:
+            return path
+
+    return _func
+
+
+def _geojson_index_writer(out_path=None, crs=None, fieldname=None):
+    # GeoJSONFileWriter can only write local files, remote files are written by GDAL
+    if path_is_remote(out_path):
+        return VectorFileWriter(
+            driver="GeoJSON", out_path=out_path, crs=crs, fieldname=fieldname
+        )
     else:
-        return path
+        return GeoJSONFileWriter(out_path=out_path, crs=crs, fieldname=fieldname)
+
+
+def _dumps(feature):
+    """Serialize a GeoJSON feature compactly using orjson if available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(feature).decode()
+        except TypeError:
+            # orjson rejects some types the json module accepts, e.g. non-str keys
+            pass
+    return json.dumps(feature, separators=(",", ":"))
+
+
+def _tile_geometry(tile):
+    # equals shapely.geometry.mapping(tile.bbox) but skips creating a shapely Polygon
+    left, bottom, right, top = tile.bounds
+    return {
+        "type": "Polygon",
+        "coordinates": (
+            ((right, bottom), (right, top), (left, top), (left, bottom), (right, bottom)),
+        )
+    }
 
 
 class VectorFileWriter():
-    """Writes GeoJSON or GeoPackage files."""
+    """Writes vector files such as GeoPackage or Shapefile using Fiona."""
 
     def __init__(
         self, out_path=None, crs=None, fieldname=None, driver=None
@@ -247,6 +288,8 @@ class VectorFileWriter():
         self.driver = driver
         self.fieldname = fieldname
         self.new_entries = 0
+        self._pending = []
+        self._tmp_dir = None
         schema = deepcopy(spatial_schema)
         schema["properties"][fieldname] = "str:254"
 
@@ -254,29 +297,46 @@ class VectorFileWriter():
             if os.path.isfile(self.path):
                 logger.debug("read existing entries")
                 with fiona.open(self.path, "r") as src:
-                    self._existing = {f["properties"]["tile_id"]: f for f in src}
+                    self._existing = {f["properties"]["tile_id"] for f in src}
                 self.sink = fiona.open(self.path, "a")
             else:
                 self.sink = fiona.open(
                     self.path, "w", driver=self.driver, crs=crs, schema=schema
                 )
-                self._existing = {}
+                self._existing = set()
         else:
+            self._existing = set()
             if os.path.isfile(self.path):
-                logger.debug("read existing entries")
+                # write into a temporary dataset which replaces the existing one on
+                # close(), so existing entries can be copied without loading them
+                # into memory
+                out_dir, basename = os.path.split(os.path.abspath(self.path))
+                self._tmp_dir = tempfile.mkdtemp(
+                    prefix="." + basename + ".", dir=out_dir
+                )
+                self.sink = fiona.open(
+                    os.path.join(self._tmp_dir, basename),
+                    "w",
+                    driver=self.driver,
+                    crs=crs,
+                    schema=schema
+                )
+                logger.debug("copy existing entries")
                 with fiona.open(self.path, "r") as src:
-                    self._existing = {f["properties"]["tile_id"]: f for f in src}
-                fiona.remove(self.path, driver=driver)
+                    self.sink.writerecords(self._tap_existing(src))
             else:
-                self._existing = {}
-            self.sink = fiona.open(
-                self.path, "w", driver=self.driver, crs=crs, schema=schema
-            )
-            self.sink.writerecords(self._existing.values())
+                self.sink = fiona.open(
+                    self.path, "w", driver=self.driver, crs=crs, schema=schema
+                )
 
     def __repr__(self):
         return "VectorFileWriter(%s)" % self.path
 
+    def _tap_existing(self, features):
+        for f in features:
+            self._existing.add(f["properties"]["tile_id"])
+            yield f
+
     def __enter__(self):
         return self
 
@@ -286,8 +346,8 @@ class VectorFileWriter():
     def write(self, tile, path):
         if not self.entry_exists(tile=tile):
             logger.debug("write %s to %s", path, self)
-            self.sink.write({
-                "geometry": mapping(tile.bbox),
+            self._pending.append({
+                "geometry": _tile_geometry(tile),
                 "properties": {
                     "tile_id": str(tile.id),
                     "zoom": str(tile.zoom),
@@ -296,16 +356,121 @@ class VectorFileWriter():
                     self.fieldname: path
                 }
             })
+            self._existing.add(str(tile.id))
+            self.new_entries += 1
+            if len(self._pending) >= VECTOR_WRITE_BATCH_SIZE:
+                self._flush()
+
+    def _flush(self):
+        # writerecords() inserts all features within one OGR transaction
+        if self._pending:
+            logger.debug("write %s features to %s", len(self._pending), self)
+            self.sink.writerecords(self._pending)
+            self._pending = []
+
+    def entry_exists(self, tile=None, path=None):
+        exists = str(tile.id) in self._existing
+        logger.debug("%s exists: %s", tile, exists)
+        return exists
+
+    def close(self):
+        logger.debug("%s new entries in %s", self.new_entries, self)
+        self._flush()
+        self.sink.close()
+        if self._tmp_dir:
+            # remove existing dataset including all of its sidecar files and move
+            # all files of the temporary dataset to the output directory
+            fiona.remove(self.path, driver=self.driver)
+            out_dir = os.path.dirname(os.path.abspath(self.path))
+            for filename in os.listdir(self._tmp_dir):
+                os.replace(
+                    os.path.join(self._tmp_dir, filename),
+                    os.path.join(out_dir, filename)
+                )
+            os.rmdir(self._tmp_dir)
+            self._tmp_dir = None
+
+
+class GeoJSONFileWriter():
+    """Writes local GeoJSON files by streaming features directly as JSON."""
+
+    def __init__(self, out_path=None, crs=None, fieldname=None):
+        self.path = out_path
+        self.fieldname = fieldname
+        self.new_entries = 0
+        logger.debug("initialize GeoJSON writer")
+        self._existing = set()
+        # write into a temporary file which replaces the existing one on close()
+        root, ext = os.path.splitext(self.path)
+        self._tmp_path = root + ".tmp" + ext
+        self.sink = open(self._tmp_path, "w")
+        self.sink.write('{"type": "FeatureCollection", ')
+        epsg = crs.to_epsg()
+        if epsg != 4326:
+            self.sink.write('"crs": %s, ' % json.dumps({
+                "type": "name",
+                "properties": {
+                    "name": (
+                        "urn:ogc:def:crs:EPSG::%s" % epsg if epsg else crs.to_wkt()
+                    )
+                }
+            }))
+        self.sink.write('"features": [')
+        self._empty = True
+        if os.path.isfile(self.path):
+            logger.debug("read existing entries")
+            features = read_json(self.path)["features"]
+            # pop features once they are written so they are not kept in memory
+            # alongside the collected tile IDs
+            features.reverse()
+            while features:
+                feature = features.pop()
+                self._write_feature(feature)
+                self._existing.add(str(feature["properties"]["tile_id"]))
+
+    def __repr__(self):
+        return "GeoJSONFileWriter(%s)" % self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write_feature(self, feature):
+        self.sink.write(
+            ("\n" if self._empty else ",\n") +
+            _dumps(feature)
+        )
+        self._empty = False
+
+    def write(self, tile, path):
+        if not self.entry_exists(tile=tile):
+            logger.debug("write %s to %s", path, self)
+            self._write_feature({
+                "type": "Feature",
+                "geometry": _tile_geometry(tile),
+                "properties": {
+                    "tile_id": str(tile.id),
+                    "zoom": tile.zoom,
+                    "row": tile.row,
+                    "col": tile.col,
+                    self.fieldname: path
+                }
+            })
+            self._existing.add(str(tile.id))
             self.new_entries += 1
 
     def entry_exists(self, tile=None, path=None):
-        exists = str(tile.id) in self._existing.keys()
+        exists = str(tile.id) in self._existing
         logger.debug("%s exists: %s", tile, exists)
         return exists
 
     def close(self):
         logger.debug("%s new entries in %s", self.new_entries, self)
+        self.sink.write("\n]}\n")
         self.sink.close()
+        os.replace(self._tmp_path, self.path)
 
 
 class TextFileWriter():
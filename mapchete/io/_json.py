@@ -7,6 +7,11 @@ from urllib.error import HTTPError
 from mapchete.io._path import makedirs
 from mapchete.io._misc import get_boto3_bucket
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +37,7 @@ def read_json(path):
     """Read local or remote."""
     if path.startswith(("http://", "https://")):
         try:
-            return json.loads(urlopen(path).read().decode())
+            return _loads(urlopen(path).read())
         except HTTPError:
             raise FileNotFoundError("%s not found", path)
     elif path.startswith("s3://"):
@@ -40,11 +45,22 @@ def read_json(path):
         key = "/".join(path.split("/")[3:])
         for obj in bucket.objects.filter(Prefix=key):
             if obj.key == key:
-                return json.loads(obj.get()['Body'].read().decode())
+                return _loads(obj.get()['Body'].read())
         raise FileNotFoundError("%s not found", path)
     else:
         try:
-            with open(path, "r") as src:
-                return json.loads(src.read())
+            with open(path, "rb") as src:
+                return _loads(src.read())
         except:
             raise FileNotFoundError("%s not found", path)
+
+
+def _loads(data):
+    """Parse JSON using orjson if available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict and rejects e.g. NaN which the json module writes
+            pass
+    return json.loads(data)
@@ -149,73 +149,24 @@ def tiles_exist(config=None, output_tiles=None, process_tiles=None):
     if not tiles:
         return
 
-    # only on TileDirectories on S3
+    # only on TileDirectories on S3 or local storage
     if (
         not config.output_reader.path.endswith(config.output_reader.file_extension) and
-        basepath.startswith("s3://")
+        (basepath.startswith("s3://") or not path_is_remote(basepath))
     ):
-        import boto3
-        basekey = "/".join(basepath.split("/")[3:])
-        bucket = basepath.split("/")[2]
-        s3 = boto3.client("s3")
-        paginator = s3.get_paginator("list_objects_v2")
-
-        # determine zoom
-        zoom = next(iter(tiles)).zoom
-
-        # get all output tiles
-        if process_tiles:
-            output_tiles = set(
-                [
-                    t
-                    for process_tile in tiles
-                    for t in config.output_pyramid.intersecting(process_tile)
-                ]
-            )
+        paths = _paths_to_tiles(config, tiles, process_tiles=process_tiles)
+        if basepath.startswith("s3://"):
+            existing = _s3_existing_tiles(paths)
         else:
-            output_tiles = tiles
-
-        # create a mapping between paths and tiles
-        paths = dict()
-        # remember rows
-        rows = set()
-        for output_tile in output_tiles:
-            if output_tile.zoom != zoom:  # pragma: no cover
-                raise ValueError("tiles of different zoom levels cannot be mixed")
-            path = config.output_reader.get_path(output_tile)
-
-            if process_tiles:
-                paths[path] = config.process_pyramid.intersecting(output_tile)[0]
-            else:
-                paths[path] = output_tile
-
-            rows.add(output_tile.row)
+            existing = _local_existing_tiles(paths)
 
         # remember already yielded tiles
         yielded = set()
-        for row in rows:
-            # use prefix until row, page through api results
-            logger.debug("check existing tiles in row %s" % row)
-            prefix = os.path.join(*[basekey, str(zoom), str(row)])
-            logger.debug("read keys %s*" % os.path.join("s3://" + bucket, prefix))
-
-            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                logger.debug("read next page")
-                try:
-                    contents = page["Contents"]
-                except KeyError:
-                    break
-
-                for obj in contents:
-                    # get matching tile
-                    try:
-                        tile = paths[os.path.join("s3://" + bucket, obj["Key"])]
-                    except KeyError:  # pragma: no cover
-                        continue
-                    # store and yield process tile if it was not already yielded
-                    if tile not in yielded:
-                        yielded.add(tile)
-                        yield (tile, True)
+        for tile in existing:
+            # store and yield tile if it was not already yielded
+            if tile not in yielded:
+                yielded.add(tile)
+                yield (tile, True)
 
         # finally, yield all tiles which were not yet yielded as False
         for tile in tiles.difference(yielded):
@@ -233,3 +184,48 @@ def tiles_exist(config=None, output_tiles=None, process_tiles=None):
                 (executor.submit(_exists, tile) for tile in tiles)
             ):
                 yield future.result()
+
+
+def _paths_to_tiles(config, tiles, process_tiles=None):
+    """Map output tile paths to the tiles passed on to tiles_exist()."""
+    paths = dict()
+    for tile in tiles:
+        if process_tiles:
+            for output_tile in config.output_pyramid.intersecting(tile):
+                paths[config.output_reader.get_path(output_tile)] = tile
+        else:
+            paths[config.output_reader.get_path(tile)] = tile
+    return paths
+
+
+def _s3_existing_tiles(paths):
+    """Yield tiles of existing S3 objects by listing each row prefix once."""
+    import boto3
+    paginator = boto3.client("s3").get_paginator("list_objects_v2")
+    for directory in set(os.path.dirname(path) for path in paths):
+        # use prefix until row, page through api results
+        bucket = directory.split("/")[2]
+        prefix = "/".join(directory.split("/")[3:])
+        logger.debug("read keys %s*", directory)
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            logger.debug("read next page")
+            for obj in page.get("Contents", []):
+                try:
+                    yield paths[os.path.join("s3://" + bucket, obj["Key"])]
+                except KeyError:  # pragma: no cover
+                    continue
+
+
+def _local_existing_tiles(paths):
+    """Yield tiles of existing local files by scanning each row directory once."""
+    for directory in set(os.path.dirname(path) for path in paths):
+        logger.debug("check existing tiles in %s", directory)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        yield paths[entry.path]
+                    except KeyError:
+                        continue
+        except FileNotFoundError:
+            continue
@@ -1,9 +1,15 @@
 """Mapchtete handling tiles."""
+from cachetools import LRUCache
 from cached_property import cached_property
 from itertools import product
 from shapely.geometry import box
+import threading
 from tilematrix import Tile, TilePyramid
 
+# pyramids created by BufferedTilePyramid.from_dict() by their frozen configuration
+_PYRAMID_CACHE = LRUCache(maxsize=32)
+_PYRAMID_CACHE_LOCK = threading.Lock()
+
 
 class BufferedTilePyramid(TilePyramid):
     """
@@ -145,8 +151,23 @@ class BufferedTilePyramid(TilePyramid):
     def from_dict(config_dict):
         """
         Initialize TilePyramid from configuration dictionary.
+
+        Pyramids are cached, so equal configurations return the same instance.
         """
-        return BufferedTilePyramid(**config_dict)
+        key = _freeze(config_dict)
+        try:
+            hash(key)
+        except TypeError:  # pragma: no cover
+            # configuration contains unhashable objects
+            return BufferedTilePyramid(**config_dict)
+        # cachetools caches are not thread-safe
+        with _PYRAMID_CACHE_LOCK:
+            pyramid = _PYRAMID_CACHE.get(key)
+        if pyramid is None:
+            pyramid = BufferedTilePyramid(**config_dict)
+            with _PYRAMID_CACHE_LOCK:
+                pyramid = _PYRAMID_CACHE.setdefault(key, pyramid)
+        return pyramid
 
     def __repr__(self):
         return 'BufferedTilePyramid(%s, tile_size=%s, metatiling=%s, pixelbuffer=%s)' % (
@@ -323,6 +344,17 @@ class BufferedTile(Tile):
         return hash(repr(self))
 
 
+def _freeze(obj):
+    # convert nested configuration into a hashable representation
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    elif isinstance(obj, (list, tuple)):
+        return tuple(_freeze(i) for i in obj)
+    else:
+        # include type so e.g. 5 and 5.0 don't share an entry and skip validation
+        return (type(obj), obj)
+
+
 def count_tiles(geometry, pyramid, minzoom, maxzoom, init_zoom=0):
     """
     Count number of tiles intersecting with geometry.
@@ -27,10 +27,11 @@ def _parse_requirements(file):
 
 # dependencies for extra features
 req_contours = ["matplotlib"]
+req_orjson = ["orjson"]
 req_s3 = ["boto3"]
 req_serve = ["flask"]
 req_vrt = ["lxml"]
-req_complete = req_contours + req_s3 + req_serve + req_vrt
+req_complete = req_contours + req_orjson + req_s3 + req_serve + req_vrt
 
 setup(
     name="mapchete",
@@ -78,6 +79,7 @@ setup(
     extras_require={
         "complete": req_complete,
         "contours": req_contours,
+        "orjson": req_orjson,
         "s3": req_s3,
         "serve": req_serve,
         "vrt": req_vrt,
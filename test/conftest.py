@@ -2,9 +2,11 @@
 
 import boto3
 from collections import namedtuple
+from http.server import HTTPServer, SimpleHTTPRequestHandler
 import os
 import pytest
 import shutil
+import threading
 import uuid
 import yaml
 
@@ -148,6 +150,49 @@ def cleantopo_br_tif():
     return os.path.join(TESTDATA_DIR, "cleantopo_br.tif")
 
 
+class _RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serve files from the temporary directory and answer byte range requests."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=TEMP_DIR, **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if "Range" not in self.headers:
+            return super().do_GET()
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return self.send_error(404)
+        size = os.path.getsize(path)
+        start, end = self.headers["Range"].split("=")[1].split("-")
+        start, end = int(start), min(int(end or size - 1), size - 1)
+        with open(path, "rb") as src:
+            src.seek(start)
+            data = src.read(end - start + 1)
+        self.send_response(206)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Range", "bytes %s-%s/%s" % (start, end, size))
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def http_tiff(mp_tmpdir):
+    """Fixture for cleantopo_br.tif served via local HTTP as in.tiff"""
+    shutil.copy(
+        os.path.join(TESTDATA_DIR, "cleantopo_br.tif"), os.path.join(mp_tmpdir, "in.tiff")
+    )
+    server = HTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%s/in.tiff" % server.server_port
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def cleantopo_tl_tif():
     """Fixture for cleantopo_tl.tif"""
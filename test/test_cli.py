@@ -359,6 +359,15 @@ def test_convert_remote_single_gtiff(http_raster, mp_tmpdir):
         assert data.any()
 
 
+def test_convert_remote_tiff_info(http_tiff):
+    """Remote inputs without a .tif extension are readable."""
+    from mapchete.cli.default.convert import _input_rasterio_info
+    output_params = _input_rasterio_info(http_tiff)["output_params"]
+    assert output_params["bands"] == 1
+    assert output_params["dtype"] == "uint16"
+    assert output_params["format"] == "GTiff"
+
+
 def test_convert_dtype(cleantopo_br_tif, mp_tmpdir):
     """Automatic tile pyramid creation using dtype scale."""
     run_cli([
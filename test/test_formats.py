@@ -1,6 +1,8 @@
 """Test Mapchete default formats."""
 
+import os
 import pytest
+import shutil
 from tilematrix import TilePyramid
 from rasterio.crs import CRS
 
@@ -50,7 +52,7 @@ def test_input_reader_errors():
         load_input_reader({"abstract": {"format": "invalid_format"}})
 
 
-def test_driver_from_file_errors(execute_kwargs_py):
+def test_driver_from_file_errors(execute_kwargs_py, mp_tmpdir):
     """Test errors when determining input driver from filename."""
     with pytest.raises(errors.MapcheteDriverError):
         driver_from_file(execute_kwargs_py)
@@ -58,6 +60,23 @@ def test_driver_from_file_errors(execute_kwargs_py):
     with pytest.raises(FileNotFoundError):
         driver_from_file("non_existing_file.tif")
 
+    # files without extension are probed by rasterio and fiona
+    no_extension = os.path.join(mp_tmpdir, "no_extension")
+    shutil.copy(execute_kwargs_py, no_extension)
+    with pytest.raises(errors.MapcheteDriverError):
+        driver_from_file(no_extension)
+
+    with pytest.raises(FileNotFoundError):
+        driver_from_file(os.path.join(mp_tmpdir, "non_existing_file"))
+
+
+def test_driver_from_file_mapchete(cleantopo_br, mp_tmpdir):
+    """Mapchete file extension is matched case-insensitively."""
+    assert driver_from_file(cleantopo_br.path) == "Mapchete"
+    upper_case = os.path.join(mp_tmpdir, "cleantopo_br.MAPCHETE")
+    shutil.copy(cleantopo_br.path, upper_case)
+    assert driver_from_file(upper_case) == "Mapchete"
+
 
 def test_mapchete_input(mapchete_input):
     """Mapchete process as input for other process."""
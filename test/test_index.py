@@ -5,6 +5,7 @@ import pytest
 import rasterio
 
 import mapchete
+from mapchete import index
 from mapchete.index import zoom_index_gen
 from mapchete.io import get_boto3_bucket
 
@@ -191,3 +192,108 @@ def test_vrt_mercator(mp_tmpdir, cleantopo_br_mercator):
             out_dir=mp.config.output.path,
             vrt=True,
         ))
+
+
+def test_geojson_mercator(mp_tmpdir, cleantopo_br_mercator):
+    zoom = 8
+    with mapchete.open(
+        dict(cleantopo_br_mercator.dict, zoom_levels=dict(min=0, max=zoom))
+    ) as mp:
+        # generate output
+        mp.batch_process(zoom=zoom)
+
+        # generate index
+        list(zoom_index_gen(
+            mp=mp,
+            zoom=zoom,
+            out_dir=mp.config.output.path,
+            geojson=True,
+        ))
+        geojson_index = os.path.join(mp.config.output.path, "%s.geojson" % zoom)
+        with fiona.open(geojson_index) as src:
+            assert src.crs["init"] == "epsg:3857"
+            features = list(src)
+            assert features
+            for f in features:
+                assert "location" in f["properties"]
+                assert f["properties"]["zoom"] == zoom
+
+        # generate index again and assert no entries are added
+        list(zoom_index_gen(
+            mp=mp,
+            zoom=zoom,
+            out_dir=mp.config.output.path,
+            geojson=True,
+        ))
+        with fiona.open(geojson_index) as src:
+            assert len(src) == len(features)
+        assert not os.path.exists(
+            os.path.join(mp.config.output.path, "%s.tmp.geojson" % zoom)
+        )
+
+
+def test_geojson_index_writer_selection(mp_tmpdir, monkeypatch):
+    crs = rasterio.crs.CRS.from_epsg(4326)
+
+    # local paths are written by GeoJSONFileWriter
+    local_path = os.path.join(mp_tmpdir, "5.geojson")
+    with index._geojson_index_writer(
+        out_path=local_path, crs=crs, fieldname="location"
+    ) as writer:
+        assert isinstance(writer, index.GeoJSONFileWriter)
+    with fiona.open(local_path) as src:
+        assert len(src) == 0
+
+    # remote paths are passed on to GDAL via VectorFileWriter
+    calls = []
+
+    def _vector_file_writer(**kwargs):
+        calls.append(kwargs)
+        return kwargs
+
+    monkeypatch.setattr(index, "VectorFileWriter", _vector_file_writer)
+    remote_path = "s3://mapchete-test/tmp/5.geojson"
+    index._geojson_index_writer(out_path=remote_path, crs=crs, fieldname="location")
+    assert calls == [
+        dict(driver="GeoJSON", out_path=remote_path, crs=crs, fieldname="location")
+    ]
+
+
+def test_vector_index_rewrite(mp_tmpdir, cleantopo_br, monkeypatch):
+    zoom = 5
+    # force VectorFileWriter to rewrite existing files instead of appending
+    for driver in ["GPKG", "ESRI Shapefile"]:
+        monkeypatch.setitem(fiona.supported_drivers, driver, "rw")
+
+    def gen_indexes():
+        list(zoom_index_gen(
+            mp=mp,
+            zoom=zoom,
+            out_dir=mp.config.output.path,
+            geojson=True,
+            gpkg=True,
+            shapefile=True
+        ))
+
+    with mapchete.open(cleantopo_br.dict) as mp:
+        mp.batch_process(zoom=zoom)
+        gen_indexes()
+        out_dir = mp.config.output.path
+        files_before = set(os.listdir(out_dir))
+
+        # add a stale Shapefile sidecar file which has to be removed on rewrite
+        stale_sidecar = os.path.join(out_dir, "%s.qix" % zoom)
+        with open(stale_sidecar, "w") as dst:
+            dst.write("stale")
+
+        # rewrite existing indexes
+        gen_indexes()
+
+    assert not os.path.exists(stale_sidecar)
+    # no temporary files or directories are left behind
+    assert set(os.listdir(out_dir)) == files_before
+    for ext in ["geojson", "gpkg", "shp"]:
+        with fiona.open(os.path.join(out_dir, "%s.%s" % (zoom, ext))) as src:
+            assert len(src) == 1
+            for f in src:
+                assert "location" in f["properties"]
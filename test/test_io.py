@@ -1,5 +1,6 @@
 """Test Mapchete io module."""
 
+import os
 import pytest
 import shutil
 import rasterio
@@ -21,7 +22,8 @@ import mapchete
 from mapchete.config import MapcheteConfig
 from mapchete.errors import GeometryTypeError
 from mapchete.io import (
-    get_best_zoom_level, path_exists, absolute_path, read_json, tile_to_zoom_level
+    get_best_zoom_level, path_exists, absolute_path, read_json, tile_to_zoom_level,
+    tiles_exist, write_json
 )
 from mapchete.io.raster import (
     read_raster_window, write_raster_window, extract_from_array,
@@ -171,6 +173,30 @@ def test_read_raster_window_input_list(cleantopo_br):
     assert np.allclose(resampled, resampled2, rtol=0.01)
 
 
+def test_tiles_exist_local(cleantopo_br):
+    process_zoom = 5
+    conf = dict(**cleantopo_br.dict)
+    conf["output"].update(metatiling=1)
+    with mapchete.open(conf) as mp:
+        mp.batch_process(process_zoom)
+        output_tiles = list(
+            mp.config.output_pyramid.tiles_from_bounds(mp.config.bounds, process_zoom)
+        )
+        existing = dict(tiles_exist(config=mp.config, output_tiles=output_tiles))
+        assert len(existing) == len(output_tiles)
+        for tile, exists in existing.items():
+            assert exists == path_exists(mp.config.output.get_path(tile))
+        assert any(existing.values())
+
+        process_tiles = list(
+            mp.config.process_pyramid.tiles_from_bounds(mp.config.bounds, process_zoom)
+        )
+        existing = dict(tiles_exist(config=mp.config, process_tiles=process_tiles))
+        assert len(existing) == len(process_tiles)
+        for tile, exists in existing.items():
+            assert exists == mp.config.output.tiles_exist(process_tile=tile)
+
+
 def test_read_raster_window_retry(invalid_tif):
     tile = BufferedTilePyramid("geodetic").tile(zoom=13, row=1918, col=8905)
     with pytest.raises(RasterioIOError):
@@ -867,6 +893,18 @@ def test_read_remote_json(s3_metadata_json, http_metadata_json):
         read_json("https://ungarj.github.io/mapchete_testdata/tiled_data/raster/cleantopo/invalid_metadata.json")
 
 
+def test_read_write_json(mp_tmpdir):
+    path = os.path.join(mp_tmpdir, "params.json")
+    params = dict(nodata=float("nan"), bounds=[1., 2., 3., 4.], name="test")
+    write_json(path, params)
+    read = read_json(path)
+    assert np.isnan(read["nodata"])
+    assert read["bounds"] == params["bounds"]
+    assert read["name"] == params["name"]
+    with pytest.raises(FileNotFoundError):
+        read_json(os.path.join(mp_tmpdir, "invalid_params.json"))
+
+
 def test_tile_to_zoom_level():
     tp_merc = BufferedTilePyramid("mercator")
     tp_geod = BufferedTilePyramid("geodetic")
@@ -1,5 +1,6 @@
 """Test Mapchete main module and processing."""
 
+import concurrent.futures
 from itertools import chain
 import pytest
 import os
@@ -567,3 +568,41 @@ def test_bufferedtiles():
     assert a != tp_buffered.tile(5, 5, 5)
 
     assert a.get_neighbors() != a.get_neighbors(connectedness=4)
+
+
+def test_bufferedtilepyramid_from_dict():
+    tp = BufferedTilePyramid("geodetic", metatiling=2, pixelbuffer=5)
+    a = BufferedTilePyramid.from_dict(tp.to_dict())
+    b = BufferedTilePyramid.from_dict(tp.to_dict())
+    assert a == tp
+    # equal configurations share one instance
+    assert a is b
+    c = BufferedTilePyramid.from_dict(dict(tp.to_dict(), pixelbuffer=0))
+    assert c is not a
+    assert c.pixelbuffer == 0
+    # equal values of other types must not hit the cache and skip validation
+    with pytest.raises(ValueError):
+        BufferedTilePyramid.from_dict(dict(tp.to_dict(), pixelbuffer=5.))
+
+
+def test_bufferedtilepyramid_from_dict_concurrent():
+    # more distinct pyramids than the pyramid cache holds, so entries get evicted
+    # while being created concurrently
+    configs = [
+        dict(grid=grid, metatiling=metatiling, pixelbuffer=pixelbuffer)
+        for grid in ["geodetic", "mercator"]
+        for metatiling in [1, 2, 4, 8]
+        for pixelbuffer in range(6)
+    ]
+    assert len(configs) > 32
+    # request every configuration several times in varying order
+    configs = configs * 4
+    configs.reverse()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+        for _ in range(3):
+            pyramids = list(executor.map(BufferedTilePyramid.from_dict, configs))
+            assert len(pyramids) == len(configs)
+            for tp, config in zip(pyramids, configs):
+                assert tp.grid.type == config["grid"]
+                assert tp.metatiling == config["metatiling"]
+                assert tp.pixelbuffer == config["pixelbuffer"]